@@ -0,0 +1,295 @@
+"""
+Shared command-line argument definitions for PDF performance testing.
+Builds the parsers used by both the CLI and the configuration module.
+"""
+
+import argparse
+import logging
+import sys
+from . import __version__
+
+# Accepted --log-level values and the logging levels they map to
+LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# Parsers are built once per process and reused on repeated invocations
+_parsers = {}
+_flat_parser = None
+
+
+# Declarative argument specs as (flag, add_argument kwargs) pairs
+OUTPUT_ARGS = [
+    (
+        "--log-level",
+        {
+            "default": "INFO",
+            "choices": LOG_LEVELS,
+            "help": "Set the logging level (default: INFO)",
+        },
+    ),
+    (
+        "--quiet",
+        {"action": "store_true", "help": "Suppress log messages in terminal output"},
+    ),
+    (
+        "--output-dir",
+        {
+            "default": None,
+            "help": "Output directory for logs and results (default: logs/pdf_perf_test)",
+        },
+    ),
+]
+
+# How the verifier checks for rendered PDFs, see --verify-mode
+VERIFY_MODES = ("head", "list", "events")
+
+VERIFY_MODE_ARGS = [
+    (
+        "--verify-mode",
+        {
+            "default": "head",
+            "choices": VERIFY_MODES,
+            "help": "Check PDFs with a HEAD request per job, by listing the bucket "
+            "or from the bucket's S3 event queue (default: head)",
+        },
+    ),
+    (
+        "--notification-queue",
+        {
+            "default": None,
+            "help": "URL of the SQS queue receiving the results bucket's "
+            "ObjectCreated events, required for --verify-mode events",
+        },
+    ),
+]
+
+COMMON_ARGS = [
+    ("--endpoint", {"required": True, "help": "API endpoint URL"}),
+    ("--template", {"required": True, "help": "Template ID to use for rendering"}),
+    (
+        "--bucket",
+        {"required": True, "help": "S3 bucket name where results are stored"},
+    ),
+    (
+        "--requests",
+        {
+            "type": int,
+            "default": 1000,
+            "help": "Number of requests to send (default: 1000)",
+        },
+    ),
+    (
+        "--batch-size",
+        {
+            "type": int,
+            "default": 10,
+            "help": "Number of requests to send in a batch (default: 10)",
+        },
+    ),
+    (
+        "--concurrency",
+        {
+            "type": int,
+            "default": 100,
+            "help": "Number of concurrent requests (default: 100)",
+        },
+    ),
+    (
+        "--request-timeout",
+        {
+            "type": int,
+            "default": 60,
+            "help": "Timeout in seconds for each attempt of a batch request "
+            "(default: 60)",
+        },
+    ),
+    (
+        "--generator-processes",
+        {
+            "type": int,
+            "default": 0,
+            "help": "Number of worker processes generating the request payloads, "
+            "0 to generate them on the event loop (default: 0)",
+        },
+    ),
+    (
+        "--region",
+        {"default": "eu-central-1", "help": "AWS region (default: eu-central-1)"},
+    ),
+    (
+        "--interval",
+        {
+            "type": int,
+            "default": 5,
+            "help": "Check interval in seconds for verification (default: 5)",
+        },
+    ),
+    (
+        "--timeout",
+        {
+            "type": int,
+            "default": 600,
+            "help": "Total timeout in seconds for verification (default: 600)",
+        },
+    ),
+    (
+        "--verify",
+        {
+            "action": "store_true",
+            "help": "Check that the rendered PDFs are in the bucket after the "
+            "load test. Off by default, the renderer answers synchronously",
+        },
+    ),
+] + VERIFY_MODE_ARGS + OUTPUT_ARGS
+
+VERIFY_ARGS = [
+    (
+        "--job-ids-file",
+        {"required": True, "help": "File containing job IDs to verify"},
+    ),
+    ("--bucket", {"required": True, "help": "S3 bucket containing rendered PDFs"}),
+    (
+        "--region",
+        {"default": "eu-central-1", "help": "AWS region (default: eu-central-1)"},
+    ),
+    (
+        "--interval",
+        {"type": int, "default": 5, "help": "Check interval in seconds (default: 5)"},
+    ),
+    (
+        "--timeout",
+        {
+            "type": int,
+            "default": 600,
+            "help": "Total timeout in seconds (default: 600)",
+        },
+    ),
+] + VERIFY_MODE_ARGS + OUTPUT_ARGS
+
+
+def _check_args(parser, args):
+    """
+    Check argument combinations that argparse can't express on its own.
+
+    Exits with a usage error, so that e.g. a missing queue URL is reported
+    before the load test runs and not after it.
+
+    Args:
+        parser (argparse.ArgumentParser): Parser the arguments came from
+        args (argparse.Namespace): Parsed arguments
+    """
+    if getattr(args, "verify_mode", None) == "events" and not getattr(
+        args, "notification_queue", None
+    ):
+        parser.error("--notification-queue is required with --verify-mode events")
+
+
+def _add_args(parser, specs):
+    """Add arguments from a list of (flag, kwargs) specs to a parser"""
+    for flag, kwargs in specs:
+        parser.add_argument(flag, **kwargs)
+
+
+def _add_common_args(parser):
+    """Add arguments shared by the 'test' and 'load' commands to a parser"""
+    _add_args(parser, COMMON_ARGS)
+
+
+def _add_verify_args(parser):
+    """Add arguments for the 'verify' command to a parser"""
+    _add_args(parser, VERIFY_ARGS)
+
+
+# Subcommands with their help text and argument builder. Only the builder of
+# the command actually being run is called, see _build_parser().
+_COMMANDS = {
+    "test": ("Run a full performance test", _add_common_args),
+    "load": ("Run just the load test phase", _add_common_args),
+    "verify": ("Run just the verification phase", _add_verify_args),
+}
+
+
+def _selected_command(argv):
+    """
+    Find the subcommand name in the arguments without fully parsing them.
+
+    The top-level parser only has flag options, so the first positional
+    argument is the subcommand.
+
+    Args:
+        argv (list): Command-line arguments without the program name
+
+    Returns:
+        str: Subcommand name, or None if there is none
+    """
+    for arg in argv:
+        if not arg.startswith("-"):
+            return arg
+    return None
+
+
+def _build_parser(argv=None):
+    """
+    Build the CLI parser with the 'test', 'load' and 'verify' subcommands.
+
+    All subcommands are registered so they show up in the help output, but
+    only the arguments of the selected subcommand are added.
+
+    Args:
+        argv (list, optional): Command-line arguments that will be parsed.
+            Defaults to sys.argv[1:].
+
+    Returns:
+        argparse.ArgumentParser: The parser, built once per subcommand.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    command = _selected_command(argv)
+    if command not in _COMMANDS:
+        command = None
+
+    if command in _parsers:
+        return _parsers[command]
+
+    parser = argparse.ArgumentParser(
+        description="PDF Performance Testing Tool",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--version", action="version", version=f"%(prog)s {__version__}"
+    )
+
+    # Add subparsers for commands
+    subparsers = parser.add_subparsers(dest="command", help="Command to run")
+    for name, (help_text, add_args) in _COMMANDS.items():
+        subparser = subparsers.add_parser(name, help=help_text)
+        if name == command:
+            add_args(subparser)
+
+    _parsers[command] = parser
+    return parser
+
+
+def _build_flat_parser():
+    """
+    Build the parser for the original command structure without subcommands.
+
+    Returns:
+        argparse.ArgumentParser: The shared parser, built on first use.
+    """
+    global _flat_parser
+    if _flat_parser is not None:
+        return _flat_parser
+
+    parser = argparse.ArgumentParser(
+        description="Performance test for PDF rendering service"
+    )
+    _add_common_args(parser)
+
+    _flat_parser = parser
+    return parser
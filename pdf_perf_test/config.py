@@ -3,10 +3,10 @@ Configuration module for PDF performance testing.
 Handles command-line arguments and provides a centralized configuration object.
 """
 
-import argparse
+import functools
 import logging
 from pathlib import Path
-import datetime
+from ._argparse_common import LOG_LEVELS, _build_flat_parser, _check_args
 
 
 class Config:
@@ -18,6 +18,7 @@ class Config:
     def __init__(self):
         """Initialize config with default values"""
         # Test parameters
+        self.command = None
         self.endpoint = None
         self.template_id = None
         self.bucket = None
@@ -25,106 +26,113 @@ class Config:
 
         # Performance parameters
         self.requests = 1000
+        self.batch_size = 10
         self.concurrency = 100
+        self.request_timeout = 60
+        self.generator_processes = 0
 
         # Verification parameters
+        self.verify = False
         self.interval = 5
         self.timeout = 600
+        self.job_ids_file = None
+        self.verify_mode = "head"
+        self.notification_queue = None
 
         # Logging parameters
         self.log_level = logging.INFO
         self.quiet = False
 
-        # Runtime parameters
-        self.timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        # Use a central logs directory without creating a new folder for each test
-        self.test_dir = Path("logs/pdf_perf_test")
+        # Runtime parameters, timestamp and test_dir are computed on first use
+        self._test_dir_created = False
 
-    def parse_args(self):
-        """Parse command-line arguments and update configuration"""
-        parser = argparse.ArgumentParser(
-            description="Performance test for PDF rendering service"
-        )
+    @functools.cached_property
+    def timestamp(self):
+        """Timestamp of the test run, taken on first access"""
+        import datetime
 
-        # Required arguments
-        parser.add_argument("--endpoint", required=True, help="API endpoint URL")
-        parser.add_argument(
-            "--template", required=True, help="Template ID to use for rendering"
-        )
-        parser.add_argument(
-            "--bucket", required=True, help="S3 bucket name where results are stored"
-        )
+        return datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
 
-        # Optional arguments
-        parser.add_argument(
-            "--requests",
-            type=int,
-            default=1000,
-            help="Number of requests to send (default: 1000)",
-        )
-        parser.add_argument(
-            "--concurrency",
-            type=int,
-            default=100,
-            help="Number of concurrent requests (default: 100)",
-        )
-        parser.add_argument(
-            "--region",
-            default="eu-central-1",
-            help="AWS region (default: eu-central-1)",
-        )
-        parser.add_argument(
-            "--interval",
-            type=int,
-            default=5,
-            help="Check interval in seconds for verification (default: 5)",
-        )
-        parser.add_argument(
-            "--timeout",
-            type=int,
-            default=600,
-            help="Total timeout in seconds for verification (default: 600)",
-        )
-        parser.add_argument(
-            "--log-level",
-            default="INFO",
-            choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
-            help="Set the logging level (default: INFO)",
-        )
-        parser.add_argument(
-            "--quiet",
-            action="store_true",
-            help="Suppress log messages in terminal output",
+    @functools.cached_property
+    def test_dir(self):
+        """Directory for logs and results, unless overridden with --output-dir"""
+        # Use a central logs directory without creating a new folder for each test
+        return Path("logs/pdf_perf_test")
+
+    def ensure_test_dir(self):
+        """
+        Create the test directory if it has not been created yet.
+
+        Returns:
+            Path: The test directory
+        """
+        if not self._test_dir_created:
+            self.test_dir.mkdir(parents=True, exist_ok=True)
+            self._test_dir_created = True
+        return self.test_dir
+
+    @classmethod
+    def from_namespace(cls, args):
+        """
+        Create a configuration from already parsed command-line arguments.
+
+        Args:
+            args (argparse.Namespace): Parsed arguments
+
+        Returns:
+            Config: New configuration object
+        """
+        return cls()._update_from_namespace(args)
+
+    def parse_args(self, argv=None):
+        """Parse command-line arguments and update configuration"""
+        parser = _build_flat_parser()
+        args = parser.parse_args(argv)
+        _check_args(parser, args)
+        return self._update_from_namespace(args)
+
+    def _update_from_namespace(self, args):
+        """
+        Update configuration from parsed arguments.
+
+        Arguments missing from the namespace (e.g. for the 'verify' command)
+        keep their current values.
+
+        Args:
+            args (argparse.Namespace): Parsed arguments
+
+        Returns:
+            Config: This configuration object
+        """
+        self.command = getattr(args, "command", self.command)
+        self.endpoint = getattr(args, "endpoint", self.endpoint)
+        self.template_id = getattr(args, "template", self.template_id)
+        self.bucket = getattr(args, "bucket", self.bucket)
+        self.requests = getattr(args, "requests", self.requests)
+        self.batch_size = getattr(args, "batch_size", self.batch_size)
+        self.concurrency = getattr(args, "concurrency", self.concurrency)
+        self.request_timeout = getattr(args, "request_timeout", self.request_timeout)
+        self.generator_processes = getattr(
+            args, "generator_processes", self.generator_processes
         )
-        parser.add_argument(
-            "--output-dir",
-            default=None,
-            help="Output directory for logs and results (default: logs/pdf_perf_test_TIMESTAMP)",
+        self.region = getattr(args, "region", self.region)
+        self.verify = getattr(args, "verify", self.verify)
+        self.interval = getattr(args, "interval", self.interval)
+        self.timeout = getattr(args, "timeout", self.timeout)
+        self.job_ids_file = getattr(args, "job_ids_file", self.job_ids_file)
+        self.verify_mode = getattr(args, "verify_mode", self.verify_mode)
+        self.notification_queue = getattr(
+            args, "notification_queue", self.notification_queue
         )
-
-        args = parser.parse_args()
-
-        # Update configuration from args
-        self.endpoint = args.endpoint
-        self.template_id = args.template
-        self.bucket = args.bucket
-        self.requests = args.requests
-        self.concurrency = args.concurrency
-        self.region = args.region
-        self.interval = args.interval
-        self.timeout = args.timeout
-        self.log_level = getattr(logging, args.log_level)
+        self.log_level = LOG_LEVELS[args.log_level]
         self.quiet = args.quiet
 
         # Override test directory if specified
         if args.output_dir:
             self.test_dir = Path(args.output_dir)
+            self._test_dir_created = False
 
         # Create the test directory
-        self.test_dir.mkdir(parents=True, exist_ok=True)
+        self.ensure_test_dir()
 
         return self
-
-
-# Singleton instance
-config = Config()
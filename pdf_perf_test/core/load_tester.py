@@ -5,12 +5,101 @@ Handles sending requests to the API endpoint and collecting metrics.
 
 import asyncio
 import aiohttp
-import json
-import time
+import contextlib
+import logging
+import math
+import random
+import ssl
 import statistics
-from pathlib import Path
-from ..utils.logging import get_logger
-from ..utils.data_generator import generate_trade_confirmation
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from ..utils.logging import CONSOLE, get_logger
+from ..utils.data_generator import _init_pools, generate_trade_confirmations
+from ..utils.serialization import JSON_HEADERS, dumps, loads
+
+# Number of latencies kept as a uniform sample for percentile calculations
+LATENCY_SAMPLE_SIZE = 10000
+
+# Number of job IDs kept in memory as a uniform sample, all of them are
+# streamed to job_ids.txt
+JOB_ID_SAMPLE_SIZE = 100
+
+# Progress is reported every PROGRESS_MASK + 1 successful requests. A power of
+# two, so that the check is a bitwise AND instead of a modulo.
+PROGRESS_MASK = 127
+
+# A batch rejected with one of these statuses, or failing with one of these
+# transient errors, is retried up to MAX_RETRIES times with exponential
+# backoff and full jitter
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+RETRY_ERRORS = (
+    aiohttp.ServerDisconnectedError,
+    aiohttp.ClientOSError,
+    aiohttp.ClientPayloadError,
+    asyncio.TimeoutError,
+)
+# Subclasses of the above that a retry can't fix, e.g. an invalid certificate
+NO_RETRY_ERRORS = (aiohttp.ClientSSLError,)
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+
+
+def _retry_delay(attempt, retry_after=None):
+    """
+    Time to wait before retrying a request.
+
+    The delay is drawn uniformly between zero and an exponentially growing
+    cap ("full jitter"), so that batches failing together don't retry
+    together. A Retry-After header in seconds takes precedence.
+
+    Args:
+        attempt: Number of the failed attempt, starting at 0
+        retry_after: Value of the response's Retry-After header, if any
+
+    Returns:
+        float: Delay in seconds
+    """
+    if retry_after is not None:
+        try:
+            return min(max(float(retry_after), 0.0), RETRY_MAX_DELAY)
+        except ValueError:
+            # An HTTP date instead of seconds, use the backoff instead
+            pass
+    return random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**attempt))
+
+
+def _build_batch_body(template_id, batch_start, batch_size):
+    """
+    Generate and serialize the payload of a batch request.
+
+    A module-level function, so that it can also run in the worker processes
+    of --generator-processes.
+
+    Args:
+        template_id: Template ID of every job
+        batch_start: Starting index for this batch
+        batch_size: Number of jobs in the batch
+
+    Returns:
+        bytes: Serialized request body
+    """
+    return dumps(
+        {
+            "jobs": [
+                {"template_id": template_id, "data": data}
+                for data in generate_trade_confirmations(batch_start, batch_size)
+            ]
+        }
+    )
+
+
+def _format_counts(counts):
+    """Format counts by kind, most frequent first, e.g. HTTP 503=3, ClientOSError=1"""
+    return ", ".join(
+        f"{kind}={count}"
+        for kind, count in sorted(counts.items(), key=lambda item: -item[1])
+    )
 
 
 class LoadTester:
@@ -27,13 +116,166 @@ class LoadTester:
         """
         self.config = config
         self.logger = get_logger("load_tester")
+        # Constant for the whole run, shared by every job payload
+        self._template_id = config.template_id
+        # TLS context shared by all connections and runs
+        self._ssl_context = None
+        # Worker processes generating the payloads while a run is going, if any
+        self._generator_pool = None
 
         # Results and metrics
         self.job_ids = []
-        self.latencies = []
+        self._job_id_count = 0
+        self._job_ids_fh = None
         self.start_time = None
         self.end_time = None
         self.successful_requests = 0
+        # Failed batches and retried attempts, by kind of error
+        self.failures = Counter()
+        self.retries = Counter()
+        self._reset_latency_stats()
+
+    def _reset_latency_stats(self):
+        """Reset the running latency statistics"""
+        self._lat_n = 0
+        self._lat_min = math.inf
+        self._lat_max = -math.inf
+        self._lat_mean = 0.0
+        self._lat_m2 = 0.0
+        self.latency_sample = []
+
+    def _update_lat(self, latency):
+        """
+        Add a request latency to the running statistics.
+
+        Mean and variance are updated with Welford's online algorithm, and a
+        fixed-size reservoir sample is kept instead of every latency.
+
+        Args:
+            latency: Request latency in seconds
+        """
+        self._lat_n += 1
+        n = self._lat_n
+
+        if latency < self._lat_min:
+            self._lat_min = latency
+        if latency > self._lat_max:
+            self._lat_max = latency
+
+        delta = latency - self._lat_mean
+        self._lat_mean += delta / n
+        self._lat_m2 += delta * (latency - self._lat_mean)
+
+        if n <= LATENCY_SAMPLE_SIZE:
+            self.latency_sample.append(latency)
+        else:
+            index = random.randrange(n)
+            if index < LATENCY_SAMPLE_SIZE:
+                self.latency_sample[index] = latency
+
+    def _add_job_id(self, job_id):
+        """
+        Write a job ID to the job IDs file and add it to the in-memory sample.
+
+        Args:
+            job_id: ID of a successfully submitted job
+        """
+        self._job_ids_fh.write(job_id + "\n")
+        self._job_id_count += 1
+
+        # Reservoir sampling keeps a uniform sample of fixed size
+        if self._job_id_count <= JOB_ID_SAMPLE_SIZE:
+            self.job_ids.append(job_id)
+        else:
+            index = random.randrange(self._job_id_count)
+            if index < JOB_ID_SAMPLE_SIZE:
+                self.job_ids[index] = job_id
+
+    def _log_progress(self, now):
+        """
+        Report the number of sent requests and the current rate.
+
+        Args:
+            now: Current event loop time
+        """
+        sent = self._job_id_count
+        self.logger.info(
+            "Sent %d requests. Current rate: %.2f req/sec",
+            sent,
+            sent / (now - self.start_time),
+            extra=CONSOLE,
+        )
+
+    def _log_failure(self, reason, msg, *args):
+        """
+        Count a failed batch and log it.
+
+        Only the first failure of each kind is also shown on the console,
+        the totals are reported with the results, so that an error storm
+        doesn't flood stdout.
+
+        Args:
+            reason: Kind of failure, e.g. "HTTP 503" or an exception name
+            msg: Log message, formatted with args
+        """
+        self.failures[reason] += 1
+        if self.failures[reason] == 1:
+            self.logger.error(msg, *args, extra=CONSOLE)
+        else:
+            self.logger.error(msg, *args)
+
+    async def _post(self, session, body):
+        """
+        Send a request body to the API, retrying transient failures.
+
+        Retried are responses with a status in RETRY_STATUSES and the
+        transient errors in RETRY_ERRORS, see _retry_delay() for the wait in
+        between. Any other status is returned and any other error raised
+        right away.
+
+        Args:
+            session: aiohttp ClientSession
+            body: Serialized request body
+
+        Returns:
+            tuple: Response status, response body and latency in seconds,
+                from the start of the first attempt, so including retries and
+                the waits in between
+
+        Raises:
+            aiohttp.ClientError, asyncio.TimeoutError: If sending failed
+        """
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                async with session.post(
+                    self.config.endpoint, data=body, headers=JSON_HEADERS
+                ) as response:
+                    status = response.status
+                    response_body = await response.read()
+                    retry_after = response.headers.get("Retry-After")
+            except RETRY_ERRORS as e:
+                if attempt == MAX_RETRIES or isinstance(e, NO_RETRY_ERRORS):
+                    raise
+                reason = type(e).__name__
+                delay = _retry_delay(attempt)
+            else:
+                if status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                    return status, response_body, loop.time() - start_time
+                reason = f"HTTP {status}"
+                delay = _retry_delay(attempt, retry_after)
+
+            # The connection is released before waiting
+            self.retries[reason] += 1
+            self.logger.debug(
+                "Retrying request in %.2fs after %s (attempt %d of %d)",
+                delay,
+                reason,
+                attempt + 1,
+                MAX_RETRIES,
+            )
+            await asyncio.sleep(delay)
 
     async def send_batch_request(self, session, batch_start):
         """
@@ -46,62 +288,64 @@ class LoadTester:
         Returns:
             list: List of booleans indicating success/failure for each request in the batch
         """
-        start_time = time.time()
-
-        batch_payloads = []
-        for i in range(self.config.batch_size):
-            request_id = batch_start + i
-            data = generate_trade_confirmation(request_id)
-            batch_payloads.append(
-                {"template_id": self.config.template_id, "data": data}
-            )
-
-        payload = {"jobs": batch_payloads}
-
         try:
-            async with session.post(self.config.endpoint, json=payload) as response:
-                response_data = json.loads(await response.text())
-                end_time = time.time()
-                batch_latency = end_time - start_time
-
-                if response.status == 200:
-                    batch_results = []
-                    # New API returns results array with job_id and s3_key
-                    for result in response_data.get("results", []):
-                        if result.get("status") == "success":
-                            self.job_ids.append(result["job_id"])
-                            self.latencies.append(batch_latency / self.config.batch_size)
-                            self.successful_requests += 1
-                            batch_results.append(True)
-                        else:
-                            batch_results.append(False)
-
-                    if len(self.job_ids) % 100 == 0:
-                        progress_msg = (
-                            f"Sent {len(self.job_ids)} requests. "
-                            f"Current rate: {len(self.job_ids) / (time.time() - self.start_time):.2f} req/sec"
-                        )
-                        if not self.config.quiet:
-                            print(progress_msg)
-                        self.logger.info(progress_msg)
-
-                    success_count = sum(1 for result in response_data.get("results", []) if result.get("status") == "success")
+            if self._generator_pool is None:
+                body = _build_batch_body(
+                    self._template_id, batch_start, self.config.batch_size
+                )
+            else:
+                body = await asyncio.get_running_loop().run_in_executor(
+                    self._generator_pool,
+                    _build_batch_body,
+                    self._template_id,
+                    batch_start,
+                    self.config.batch_size,
+                )
+            status, response_body, batch_latency = await self._post(session, body)
+            if status == 200:
+                response_data = loads(response_body)
+                batch_results = []
+                # Bind hot-loop lookups once per batch
+                add_job_id = self._add_job_id
+                update_latency = self._update_lat
+                request_latency = batch_latency / self.config.batch_size
+                success_count = 0
+                # New API returns results array with job_id and s3_key
+                for result in response_data.get("results", []):
+                    if result.get("status") == "success":
+                        add_job_id(result["job_id"])
+                        update_latency(request_latency)
+                        success_count += 1
+                        batch_results.append(True)
+                        # Each success is counted exactly once, so every
+                        # threshold is reported exactly once
+                        if (self._job_id_count & PROGRESS_MASK) == 0:
+                            self._log_progress(asyncio.get_running_loop().time())
+                    else:
+                        batch_results.append(False)
+                self.successful_requests += success_count
+
+                if self.logger.isEnabledFor(logging.DEBUG):
                     self.logger.debug(
-                        f"Batch request starting at {batch_start} succeeded with {success_count} successful results, "
-                        f"latency: {batch_latency:.4f}s"
+                        "Batch request starting at %d succeeded with %d successful results, "
+                        "latency: %.4fs",
+                        batch_start,
+                        success_count,
+                        batch_latency,
                     )
-                    return batch_results
-                else:
-                    error_msg = f"Error response {response.status}: {response_data}"
-                    if not self.config.quiet:
-                        print(error_msg)
-                    self.logger.error(error_msg)
-                    return [False] * self.config.batch_size
+                return batch_results
+            else:
+                # Error responses from a gateway or proxy may not be JSON
+                try:
+                    response_data = loads(response_body)
+                except ValueError:
+                    response_data = response_body.decode(errors="replace")
+                self._log_failure(
+                    f"HTTP {status}", "Error response %s: %s", status, response_data
+                )
+                return [False] * self.config.batch_size
         except Exception as e:
-            error_msg = f"Batch request error: {e}"
-            if not self.config.quiet:
-                print(error_msg)
-            self.logger.error(error_msg)
+            self._log_failure(type(e).__name__, "Batch request error: %s", e)
             return [False] * self.config.batch_size
 
     async def run(self):
@@ -111,70 +355,122 @@ class LoadTester:
         Returns:
             dict: Test results
         """
-        self.start_time = time.time()
+        loop = asyncio.get_running_loop()
+        self.start_time = loop.time()
         self.job_ids = []
-        self.latencies = []
+        self._job_id_count = 0
         self.successful_requests = 0
+        self.failures.clear()
+        self.retries.clear()
+        self._reset_latency_stats()
+
+        self.logger.info(
+            "Starting load test: %d requests with concurrency %d and batch size %d",
+            self.config.requests,
+            self.config.concurrency,
+            self.config.batch_size,
+            extra=CONSOLE,
+        )
+        self.logger.info("API Endpoint: %s", self.config.endpoint, extra=CONSOLE)
+        self.logger.info("Template ID: %s", self.config.template_id, extra=CONSOLE)
+
+        # Create a connection pool with specified limits. Connections are kept
+        # alive and DNS results cached, so refilling the pool doesn't resolve
+        # the endpoint or build a new TLS context again.
+        if self._ssl_context is None:
+            self._ssl_context = ssl.create_default_context()
+        connector = aiohttp.TCPConnector(
+            limit=self.config.concurrency,
+            limit_per_host=self.config.concurrency,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True,
+            ssl=self._ssl_context,
+        )
+        self.logger.debug(
+            "Created TCP connector with limit %d", self.config.concurrency
+        )
 
-        start_msg = (
-            f"Starting load test: {self.config.requests} requests with "
-            f"concurrency {self.config.concurrency} and batch size {self.config.batch_size}"
+        # Bound every attempt of a batch request, so that a hung request
+        # only holds up its worker until it is retried, see _post()
+        timeout = aiohttp.ClientTimeout(
+            total=self.config.request_timeout, sock_connect=10
         )
-        if not self.config.quiet:
-            print(start_msg)
-        self.logger.info(start_msg)
-
-        endpoint_msg = f"API Endpoint: {self.config.endpoint}"
-        template_msg = f"Template ID: {self.config.template_id}"
-        if not self.config.quiet:
-            print(endpoint_msg)
-            print(template_msg)
-        self.logger.info(endpoint_msg)
-        self.logger.info(template_msg)
-
-        # Create a connection pool with specified limits
-        connector = aiohttp.TCPConnector(limit=self.config.concurrency)
-        self.logger.debug(f"Created TCP connector with limit {self.config.concurrency}")
-
-        async with aiohttp.ClientSession(connector=connector) as session:
-            # Create a list of batch tasks
-            tasks = [
-                self.send_batch_request(session, i)
-                for i in range(0, self.config.requests, self.config.batch_size)
-            ]
-            self.logger.debug(f"Created {len(tasks)} batch request tasks")
 
-            # Execute tasks in batches to maintain concurrency
-            for i in range(0, len(tasks), self.config.concurrency):
-                batch = tasks[i : i + self.config.concurrency]
-                self.logger.debug(
-                    f"Executing batch of {len(batch)} tasks starting at index {i}"
+        # Payloads are generated in worker processes if requested, instead of
+        # on the event loop between requests
+        processes = self.config.generator_processes
+        if processes > 0:
+            generators = ProcessPoolExecutor(processes, initializer=_init_pools)
+        else:
+            generators = contextlib.nullcontext()
+
+        # Job IDs are streamed to disk as they arrive, for verification
+        job_ids_path = self.config.test_dir / "job_ids.txt"
+        with generators as self._generator_pool:
+            # Fill the customer data pools before the clock starts, either
+            # here or by starting all generator processes
+            if self._generator_pool is None:
+                _init_pools()
+            else:
+                await asyncio.gather(
+                    *(
+                        loop.run_in_executor(self._generator_pool, int)
+                        for _ in range(processes)
+                    )
                 )
-                await asyncio.gather(*batch)
+                self.logger.debug("Started %d generator processes", processes)
+            self.start_time = loop.time()
+
+            with open(job_ids_path, "w", buffering=1 << 20) as self._job_ids_fh:
+                async with aiohttp.ClientSession(
+                    connector=connector, timeout=timeout
+                ) as session:
+                    # A fixed pool of `concurrency` workers, matching the
+                    # connector limit, pulls batches from one shared iterator.
+                    # Memory stays flat regardless of the number of requests,
+                    # and a slow batch only holds up its own worker.
+                    batch_starts = iter(
+                        range(0, self.config.requests, self.config.batch_size)
+                    )
+
+                    async def worker():
+                        for batch_start in batch_starts:
+                            await self.send_batch_request(session, batch_start)
+
+                    await asyncio.gather(
+                        *(worker() for _ in range(self.config.concurrency))
+                    )
+        self._generator_pool = None
 
         # Calculate statistics
-        self.end_time = time.time()
+        self.end_time = loop.time()
         duration = self.end_time - self.start_time
 
         results = {
             "total_time": duration,
             "successful_requests": self.successful_requests,
             "total_requests": self.config.requests,
-            "job_ids": self.job_ids,
+            "job_ids_file": str(job_ids_path),
+            "job_id_sample": self.job_ids,
             "throughput": self.successful_requests / duration if duration > 0 else 0,
+            "failed_batches": dict(self.failures),
+            "retries": dict(self.retries),
         }
 
-        if self.latencies:
+        if self._lat_n:
             results.update(
                 {
-                    "min_latency": min(self.latencies),
-                    "max_latency": max(self.latencies),
-                    "avg_latency": statistics.mean(self.latencies),
+                    "min_latency": self._lat_min,
+                    "max_latency": self._lat_max,
+                    "avg_latency": self._lat_mean,
                 }
             )
 
-            if len(self.latencies) > 1:
-                results["latency_stddev"] = statistics.stdev(self.latencies)
+            if self._lat_n > 1:
+                results["latency_stddev"] = math.sqrt(
+                    self._lat_m2 / (self._lat_n - 1)
+                )
 
         # Extrapolation to 1 million
         if results["throughput"] > 0:
@@ -182,32 +478,27 @@ class LoadTester:
             results["time_for_million_seconds"] = time_for_million
             results["time_for_million_minutes"] = time_for_million / 60
 
-        # Save results
-        self._save_results(results)
+        # Calculate latency percentiles from the latency sample, with a
+        # single sort of the sample. The inclusive method interpolates
+        # between the sampled latencies, and never goes beyond the maximum.
+        if len(self.latency_sample) > 1:
+            percentiles = statistics.quantiles(
+                self.latency_sample, n=100, method="inclusive"
+            )
+            results["p50_latency"] = percentiles[49]
+            results["p90_latency"] = percentiles[89]
+            results["p99_latency"] = percentiles[98]
+        elif self.latency_sample:
+            for name in ("p50", "p90", "p99"):
+                results[f"{name}_latency"] = self.latency_sample[0]
+
+        # Job IDs were already streamed to file during the run. The results
+        # themselves are saved by the TestRunner together with its own data.
+        self.logger.info(f"Saved {self._job_id_count} job IDs to {job_ids_path}")
         self._log_results(results)
 
         return results
 
-    def _save_results(self, results):
-        """
-        Save test results to files.
-
-        Args:
-            results: Test result dictionary
-        """
-        # Save job IDs to file for verification
-        job_ids_path = self.config.test_dir / "job_ids.txt"
-        with open(job_ids_path, "w") as f:
-            for job_id in self.job_ids:
-                f.write(f"{job_id}\n")
-        self.logger.info(f"Saved {len(self.job_ids)} job IDs to {job_ids_path}")
-
-        # Save full results as JSON
-        results_path = self.config.test_dir / "load_test_results.json"
-        with open(results_path, "w") as f:
-            json.dump(results, f, indent=2)
-        self.logger.info(f"Saved load test results to {results_path}")
-
     def _log_results(self, results):
         """
         Log the results of the load test.
@@ -215,18 +506,6 @@ class LoadTester:
         Args:
             results: Load test results dictionary
         """
-        # Save results to file
-        results_file = self.config.test_dir / "load_test_results.json"
-        with open(results_file, "w") as f:
-            json.dump(results, f, indent=2)
-        self.logger.info(f"Saved load test results to {results_file}")
-
-        # Calculate P90 latency if we have the raw latencies
-        if "latencies" in results and len(results["latencies"]) > 0:
-            sorted_latencies = sorted(results["latencies"])
-            p90_index = int(len(sorted_latencies) * 0.9)
-            results["p90_latency"] = sorted_latencies[p90_index]
-
         # Add to log file, but make console output more minimal
         self.logger.info("\n--- Load Test Results ---")
 
@@ -241,6 +520,13 @@ class LoadTester:
         )
         self.logger.info(throughput_msg)
 
+        for key, label in (
+            ("failed_batches", "Failed batches"),
+            ("retries", "Retries"),
+        ):
+            if results[key]:
+                self.logger.info(f"{label}: {_format_counts(results[key])}")
+
         # Log latency metrics if available
         if "min_latency" in results:
             min_latency_msg = f"Min latency: {results['min_latency']:.4f} seconds"
@@ -250,10 +536,12 @@ class LoadTester:
             self.logger.info(max_latency_msg)
             self.logger.info(avg_latency_msg)
 
-            # Add P90 latency to logs
+            # Add latency percentiles to logs
             if "p90_latency" in results:
-                p90_latency_msg = f"P90 latency: {results['p90_latency']:.4f} seconds"
-                self.logger.info(p90_latency_msg)
+                for name in ("p50", "p90", "p99"):
+                    self.logger.info(
+                        f"{name.upper()} latency: {results[f'{name}_latency']:.4f} seconds"
+                    )
 
             if "latency_stddev" in results:
                 stddev_msg = f"Latency standard deviation: {results['latency_stddev']:.4f} seconds"
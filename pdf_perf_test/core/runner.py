@@ -3,15 +3,12 @@ Test runner module for PDF rendering performance tests.
 Orchestrates the entire performance test process.
 """
 
-import asyncio
-import json
-import os
-import time
+import functools
 import random
-from pathlib import Path
-from ..utils.logging import get_logger
-from .load_tester import LoadTester
-from .verifier import Verifier
+import time
+from ..utils.logging import CONSOLE, get_logger
+from ..utils.serialization import write_json
+from .load_tester import LoadTester, _format_counts
 
 
 class TestRunner:
@@ -29,10 +26,16 @@ class TestRunner:
         self.config = config
         self.logger = get_logger("test_runner")
         self.load_tester = LoadTester(config)
-        self.verifier = Verifier(config)
         self.start_time = None
         self.end_time = None
 
+    @functools.cached_property
+    def verifier(self):
+        """Verifier for the rendered PDFs, created (loading aiobotocore) on first use"""
+        from .verifier import Verifier
+
+        return Verifier(self.config)
+
     async def run(self):
         """
         Run the complete performance test.
@@ -40,7 +43,7 @@ class TestRunner:
         Returns:
             dict: Combined test results
         """
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.logger.info("Starting PDF rendering performance test")
         self.logger.info(f"Test directory: {self.config.test_dir}")
 
@@ -64,9 +67,14 @@ class TestRunner:
             processing_time = load_test_results["total_time"]
             self.logger.info(f"Total processing time: {processing_time:.2f} seconds")
 
-            # Create final results (no verification needed)
             final_results = self._create_final_results(load_test_results, processing_time)
 
+            # Check that the PDFs were rendered, if requested with --verify
+            if self.config.verify:
+                verification = await self._verify(load_test_results)
+                if verification is not None:
+                    final_results["verification"] = verification
+
             # Save results
             self._save_results(final_results)
 
@@ -76,20 +84,44 @@ class TestRunner:
             return final_results
 
         except Exception as e:
-            self.logger.exception(f"Error during performance test: {str(e)}")
-            if not self.config.quiet:
-                print(f"Error during performance test: {str(e)}")
+            self.logger.error("Error during performance test: %s", e, extra=CONSOLE)
+            self.logger.exception("Error during performance test: %s", e)
             return {"status": "error", "error": str(e)}
         finally:
-            self.end_time = time.time()
+            self.end_time = time.monotonic()
             total_duration = self.end_time - self.start_time
             self.logger.info(f"Total test duration: {total_duration:.2f} seconds")
 
 
+    async def _verify(self, load_results):
+        """
+        Verify the PDFs of the jobs submitted by the load test.
+
+        Args:
+            load_results: Results from load test
+
+        Returns:
+            dict: Verification results, or None if no job was submitted
+        """
+        # All job IDs were streamed to file, the results only keep a sample
+        job_ids = self._sample_job_ids(
+            self.verifier.load_job_ids(load_results["job_ids_file"])
+        )
+        if not job_ids:
+            self.logger.info("No jobs to verify", extra=CONSOLE)
+            return None
+
+        self.logger.info("\nVerifying rendered PDFs...")
+        self.verifier.job_ids = job_ids
+        return await self.verifier.verify()
+
     def _sample_job_ids(self, job_ids, max_sample=100):
         """
         Sample a maximum of max_sample job IDs from the list.
 
+        Only the 'head' verify mode samples: listing the bucket or reading
+        its event queue costs the same for all jobs as for a sample.
+
         Args:
             job_ids: List of all job IDs
             max_sample: Maximum number of job IDs to sample
@@ -100,7 +132,7 @@ class TestRunner:
         if not job_ids:
             return []
 
-        if len(job_ids) <= max_sample:
+        if self.config.verify_mode != "head" or len(job_ids) <= max_sample:
             return job_ids
 
         self.logger.info(f"Sampling {max_sample} job IDs from {len(job_ids)} total")
@@ -117,6 +149,13 @@ class TestRunner:
         Returns:
             dict: Final results
         """
+        # Processing rate and the time 1 million PDFs would take, computed once
+        throughput = (
+            load_results["successful_requests"] / processing_time
+            if processing_time > 0
+            else 0
+        )
+
         results = {
             "timestamp": str(time.time()),
             "load_test": {
@@ -124,23 +163,22 @@ class TestRunner:
                 "successful_requests": load_results["successful_requests"],
                 "duration_seconds": load_results["total_time"],
                 "throughput_per_second": load_results["throughput"],
+                "failed_batches": load_results["failed_batches"],
+                "retries": load_results["retries"],
             },
             "processing": {
                 "total_processing_time": processing_time,
-                "throughput_per_second": load_results["successful_requests"]
-                / processing_time
-                if processing_time > 0
-                else 0,
+                "throughput_per_second": throughput,
             },
         }
 
         # Add performance extrapolation
-        if processing_time > 0 and load_results["successful_requests"] > 0:
-            throughput = load_results["successful_requests"] / processing_time
+        if throughput > 0:
+            million_seconds = 1000000 / throughput
             results["performance"] = {
                 "throughput_per_second": throughput,
-                "extrapolated_million_seconds": 1000000 / throughput,
-                "extrapolated_million_minutes": (1000000 / throughput) / 60,
+                "extrapolated_million_seconds": million_seconds,
+                "extrapolated_million_minutes": million_seconds / 60,
             }
             results["performance"]["goal_achieved"] = (
                 results["performance"]["extrapolated_million_minutes"] <= 10
@@ -157,6 +195,11 @@ class TestRunner:
                 results["load_test"]["latency"]["stddev"] = load_results[
                     "latency_stddev"
                 ]
+            for name in ("p50", "p90", "p99"):
+                if f"{name}_latency" in load_results:
+                    results["load_test"]["latency"][name] = load_results[
+                        f"{name}_latency"
+                    ]
 
         return results
 
@@ -168,8 +211,7 @@ class TestRunner:
             results: Results dictionary
         """
         results_file = self.config.test_dir / "performance_test_results.json"
-        with open(results_file, "w") as f:
-            json.dump(results, f, indent=2)
+        write_json(results_file, results)
         self.logger.info(f"Saved performance test results to {results_file}")
 
     def _log_summary(self, results):
@@ -204,12 +246,33 @@ class TestRunner:
                 print(
                     f"  Latency: min={load_test['latency']['min']:.4f}s max={load_test['latency']['max']:.4f}s avg={load_test['latency']['avg']:.4f}s"
                 )
+                if "p90" in load_test["latency"]:
+                    print(
+                        f"           p50={load_test['latency']['p50']:.4f}s p90={load_test['latency']['p90']:.4f}s p99={load_test['latency']['p99']:.4f}s"
+                    )
 
             print(
                 f"  Throughput: {load_test['throughput_per_second']:.2f} PDFs/second"
             )
+            if load_test["failed_batches"]:
+                print(f"  Failed batches: {_format_counts(load_test['failed_batches'])}")
+            if load_test["retries"]:
+                print(f"  Retries: {_format_counts(load_test['retries'])}")
             print()
 
+            # Verification of the rendered PDFs
+            verification = results.get("verification")
+            if verification is not None:
+                if "status" in verification:
+                    print(
+                        f"Verification: {verification['status']} after {verification['completed_jobs']}/{verification['total_jobs']} PDFs"
+                    )
+                else:
+                    print(
+                        f"Verification: {verification['completed_jobs']}/{verification['total_jobs']} PDFs found in {verification['elapsed_seconds']:.2f}s"
+                    )
+                print()
+
             # Summary and goal achievement
             if "performance" in results:
                 print(
@@ -3,12 +3,83 @@ Verifier module for PDF rendering performance tests.
 Handles verification of generated PDFs in S3 bucket.
 """
 
-import boto3
-import json
+import asyncio
+import contextlib
+import functools
+import math
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from pathlib import Path
-from ..utils.logging import get_logger
+from urllib.parse import unquote_plus
+from botocore.exceptions import ClientError
+
+try:
+    from aiobotocore.config import AioConfig
+    from aiobotocore.session import get_session
+except ImportError:
+    # Fallback to synchronous boto3 clients run on a thread pool if
+    # aiobotocore is not installed
+    import boto3
+    from botocore.config import Config as BotoConfig
+
+    get_session = None
+from ..utils.logging import CONSOLE, get_logger
+from ..utils.serialization import loads, write_json
+
+# Error codes S3 returns for a HEAD on a key that does not exist (yet)
+NOT_FOUND_CODES = {"404", "NoSuchKey", "NotFound"}
+
+# Longest wait SQS allows for a single receive_message long poll
+MAX_WAIT_TIME_SECONDS = 20
+
+# The wait between polling rounds grows by this factor after every round
+# without newly completed jobs, up to MAX_POLL_INTERVAL seconds
+POLL_BACKOFF = 1.5
+MAX_POLL_INTERVAL = 60
+
+
+class _ThreadedClient:
+    """
+    Async interface to a synchronous boto3 client, running its calls on a
+    thread pool. boto3 clients are thread-safe and serve up to
+    max_pool_connections requests at once.
+    """
+
+    def __init__(self, client, executor):
+        self._client = client
+        self._executor = executor
+
+    def __getattr__(self, name):
+        method = getattr(self._client, name)
+
+        async def call(**kwargs):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, functools.partial(method, **kwargs)
+            )
+
+        return call
+
+    def get_paginator(self, name):
+        """Paginator whose paginate() yields the pages asynchronously"""
+        return _ThreadedPaginator(self._client.get_paginator(name), self._executor)
+
+
+class _ThreadedPaginator:
+    """Async iteration over the pages of a synchronous boto3 paginator"""
+
+    def __init__(self, paginator, executor):
+        self._paginator = paginator
+        self._executor = executor
+
+    async def paginate(self, **kwargs):
+        loop = asyncio.get_running_loop()
+        pages = iter(self._paginator.paginate(**kwargs))
+        while True:
+            page = await loop.run_in_executor(self._executor, next, pages, None)
+            if page is None:
+                return
+            yield page
 
 
 class Verifier:
@@ -28,11 +99,15 @@ class Verifier:
         self.logger = get_logger("verifier")
         self.job_ids = job_ids
         self.completed_jobs = set()
+        self.pending = set()
         self.start_time = None
         self.end_time = None
 
-        # Initialize S3 client
-        self.s3 = boto3.client("s3", region_name=self.config.region)
+        # Clients are created from this session when verification starts
+        self.session = get_session() if get_session is not None else None
+        self.s3 = None
+        self.sqs = None
+        self._exit_stack = None
 
     def load_job_ids(self, job_ids_file=None):
         """
@@ -40,21 +115,197 @@ class Verifier:
 
         Args:
             job_ids_file (str, optional): Path to file containing job IDs.
-                If None, uses default path in test directory.
+                If None, uses --job-ids-file, or the default path in the test
+                directory if that wasn't given either.
 
         Returns:
             list: List of job IDs
         """
+        if not job_ids_file:
+            job_ids_file = self.config.job_ids_file
         if not job_ids_file:
             job_ids_file = self.config.test_dir / "job_ids.txt"
 
         with open(job_ids_file, "r") as f:
-            job_ids = [line.strip() for line in f if line.strip()]
-            self.logger.debug(f"Loaded {len(job_ids)} job IDs from {job_ids_file}")
-            self.job_ids = job_ids
-            return job_ids
+            # One read, split on whitespace, also drops empty lines
+            job_ids = f.read().split()
+        self.logger.debug("Loaded %d job IDs from %s", len(job_ids), job_ids_file)
+        self.job_ids = job_ids
+        return job_ids
+
+    def _client_options(self):
+        """
+        Options shared by the S3 and SQS clients.
+
+        One connection per concurrent request, TCP keepalive so idle pooled
+        connections survive between polling rounds, and adaptive retries,
+        which also rate limit the client when S3 throttles.
+
+        Returns:
+            dict: Keyword arguments for AioConfig / botocore Config
+        """
+        return {
+            "max_pool_connections": self.config.concurrency,
+            "tcp_keepalive": True,
+            "retries": {"mode": "adaptive", "max_attempts": 10},
+        }
+
+    async def _create_client(self):
+        """
+        Create the clients used for all polling rounds of a verification.
+
+        The clients are closed again when the exit stack is closed.
+        """
+        if self.config.verify_mode == "events" and not self.config.notification_queue:
+            raise ValueError("--verify-mode events requires --notification-queue")
+
+        self._exit_stack = contextlib.AsyncExitStack()
+        if self.session is None:
+            self._create_threaded_clients()
+            return
+
+        self.s3 = await self._exit_stack.enter_async_context(
+            self.session.create_client(
+                "s3",
+                region_name=self.config.region,
+                config=AioConfig(**self._client_options()),
+            )
+        )
+        if self.config.verify_mode == "events":
+            self.sqs = await self._exit_stack.enter_async_context(
+                self.session.create_client(
+                    "sqs",
+                    region_name=self.config.region,
+                    config=AioConfig(**self._client_options()),
+                )
+            )
+
+    def _create_threaded_clients(self):
+        """
+        Create boto3 clients running on a thread pool, without aiobotocore.
+
+        The pool has one thread per connection of the client's pool, so up
+        to `concurrency` requests run at once, like with aiobotocore.
+        """
+        executor = ThreadPoolExecutor(max_workers=self.config.concurrency)
+        self._exit_stack.callback(executor.shutdown)
+        client = boto3.client(
+            "s3",
+            region_name=self.config.region,
+            config=BotoConfig(**self._client_options()),
+        )
+        self.s3 = _ThreadedClient(client, executor)
+        if self.config.verify_mode == "events":
+            client = boto3.client(
+                "sqs",
+                region_name=self.config.region,
+                config=BotoConfig(**self._client_options()),
+            )
+            self.sqs = _ThreadedClient(client, executor)
+
+    async def _head(self, semaphore, job_id):
+        """
+        Check whether the PDF for a job exists in S3.
+
+        Args:
+            semaphore (asyncio.Semaphore): Bounds the number of concurrent requests
+            job_id (str): Job ID to check
+
+        Returns:
+            bool: True if the PDF exists
+        """
+        async with semaphore:
+            try:
+                await self.s3.head_object(
+                    Bucket=self.config.bucket, Key=f"{job_id}.pdf"
+                )
+            except ClientError as e:
+                # Only a missing PDF means "not yet complete", anything else
+                # (e.g. throttling or access errors) is a real error
+                if e.response.get("Error", {}).get("Code") not in NOT_FOUND_CODES:
+                    raise
+                self.logger.debug("Job %s not yet complete", job_id)
+                return False
+        self.logger.debug("Job %s is complete", job_id)
+        return True
+
+    async def _list_completed(self, job_ids):
+        """
+        Find the jobs whose PDF exists in S3 with a paginated bucket listing.
+
+        Each LIST request returns up to 1000 keys, so this needs far fewer
+        requests than a HEAD per job.
 
-    def verify(self):
+        Args:
+            job_ids (set): Job IDs to check
+
+        Returns:
+            set: The job IDs from job_ids whose PDF exists
+        """
+        existing = set()
+        paginator = self.s3.get_paginator("list_objects_v2")
+        async for page in paginator.paginate(Bucket=self.config.bucket):
+            for obj in page.get("Contents", []):
+                key = obj["Key"]
+                if key.endswith(".pdf"):
+                    existing.add(key[:-4])
+        return job_ids & existing
+
+    async def _receive_completed(self, job_ids, wait_time):
+        """
+        Find the jobs whose PDF was created from the bucket's S3 event queue.
+
+        The first receive long-polls for up to wait_time seconds, after
+        that the messages already queued are drained without waiting.
+        Received messages are deleted, including those for other jobs.
+
+        Args:
+            job_ids (set): Job IDs to check
+            wait_time (int): Seconds to wait for the first message
+
+        Returns:
+            list: The job IDs from job_ids whose PDF was created
+        """
+        queue_url = self.config.notification_queue
+        remaining = set(job_ids)
+        completed = []
+        while remaining:
+            response = await self.sqs.receive_message(
+                QueueUrl=queue_url,
+                MaxNumberOfMessages=10,
+                WaitTimeSeconds=wait_time,
+            )
+            messages = response.get("Messages", [])
+            if not messages:
+                break
+
+            for message in messages:
+                # Test events sent when the notification is set up have no records
+                for record in loads(message["Body"]).get("Records", []):
+                    key = unquote_plus(record["s3"]["object"]["key"])
+                    job_id = key[:-4] if key.endswith(".pdf") else key
+                    if job_id in remaining:
+                        remaining.discard(job_id)
+                        completed.append(job_id)
+
+            # One request deletes all (up to 10) received messages
+            response = await self.sqs.delete_message_batch(
+                QueueUrl=queue_url,
+                Entries=[
+                    {"Id": str(i), "ReceiptHandle": message["ReceiptHandle"]}
+                    for i, message in enumerate(messages)
+                ],
+            )
+            # Messages that failed to delete are received again after their
+            # visibility timeout, their jobs are already counted by then
+            for failure in response.get("Failed", []):
+                self.logger.warning(
+                    f"Failed to delete notification message: {failure.get('Message')}"
+                )
+            wait_time = 0
+        return completed
+
+    async def verify(self):
         """
         Verify completion of PDF rendering jobs.
 
@@ -65,52 +316,67 @@ class Verifier:
             self.load_job_ids()
 
         total_jobs = len(self.job_ids)
-        self.logger.info(f"Starting verification of {total_jobs} job IDs")
-        if not self.config.quiet:
-            print(f"Verifying {total_jobs} jobs")
+        self.logger.info(f"Verifying {total_jobs} jobs", extra=CONSOLE)
 
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.completed_jobs = set()
+        # Jobs not yet verified, only shrinks by the jobs found in each round
+        self.pending = set(self.job_ids)
+
+        # Up to `concurrency` HEAD requests are in flight at once, matching
+        # the client's connection pool
+        semaphore = asyncio.Semaphore(self.config.concurrency)
+
+        # Wait between rounds, grows while no jobs complete
+        poll_interval = self.config.interval
+        max_poll_interval = max(MAX_POLL_INTERVAL, self.config.interval)
 
         try:
-            while time.time() - self.start_time < self.config.timeout:
-                # Check for jobs not yet verified
-                jobs_to_check = [
-                    job_id
-                    for job_id in self.job_ids
-                    if job_id not in self.completed_jobs
-                ]
+            await self._create_client()
+
+            while time.monotonic() - self.start_time < self.config.timeout:
+                jobs_to_check = self.pending
 
                 if not jobs_to_check:
                     completion_msg = "All jobs completed!"
-                    if not self.config.quiet:
-                        print(completion_msg)
-                    self.logger.info(completion_msg)
+                    self.logger.info(completion_msg, extra=CONSOLE)
                     break
 
                 check_msg = f"\nChecking {len(jobs_to_check)} remaining jobs..."
-                if not self.config.quiet:
-                    print(check_msg)
-                self.logger.info(check_msg)
-
-                # Check batch of jobs
-                newly_completed = 0
-                for job_id in jobs_to_check:
-                    try:
-                        # Check if PDF exists in S3
-                        self.s3.head_object(
-                            Bucket=self.config.bucket, Key=f"{job_id}.pdf"
-                        )
-                        self.completed_jobs.add(job_id)
-                        newly_completed += 1
-                        self.logger.debug(f"Job {job_id} is complete")
-                    except Exception as e:
-                        # PDF not found, continue checking
-                        self.logger.debug(f"Job {job_id} not yet complete: {str(e)}")
-                        pass
+                self.logger.info(check_msg, extra=CONSOLE)
+
+                if self.config.verify_mode == "events":
+                    # Long-poll the S3 event queue, this also replaces the
+                    # wait between rounds. The wait is rounded up to whole
+                    # seconds, so the last second before the timeout is one
+                    # more long poll, not a loop of receives that don't wait.
+                    remaining_time = self.config.timeout - (
+                        time.monotonic() - self.start_time
+                    )
+                    wait_time = max(
+                        1, min(MAX_WAIT_TIME_SECONDS, math.ceil(remaining_time))
+                    )
+                    just_found = await self._receive_completed(
+                        jobs_to_check, wait_time
+                    )
+                elif self.config.verify_mode == "list":
+                    # One paginated LIST instead of a HEAD per job
+                    just_found = await self._list_completed(jobs_to_check)
+                else:
+                    # Check all remaining jobs concurrently
+                    checked = list(jobs_to_check)
+                    found = await asyncio.gather(
+                        *(self._head(semaphore, job_id) for job_id in checked)
+                    )
+                    just_found = [
+                        job_id for job_id, exists in zip(checked, found) if exists
+                    ]
+                self.pending.difference_update(just_found)
+                self.completed_jobs.update(just_found)
+                newly_completed = len(just_found)
 
                 # Print progress
-                elapsed = time.time() - self.start_time
+                elapsed = time.monotonic() - self.start_time
                 completion_percentage = len(self.completed_jobs) / total_jobs * 100
                 current_rate = len(self.completed_jobs) / elapsed if elapsed > 0 else 0
 
@@ -119,35 +385,46 @@ class Verifier:
                 rate_msg = f"Current rate: {current_rate:.2f} PDFs/second"
                 new_msg = f"Newly completed in this batch: {newly_completed}"
 
-                if not self.config.quiet:
-                    print(time_msg)
-                    print(completion_msg)
-                    print(rate_msg)
-                    print(new_msg)
-
-                self.logger.info(time_msg)
-                self.logger.info(completion_msg)
-                self.logger.info(rate_msg)
-                self.logger.info(new_msg)
+                progress_lines = [time_msg, completion_msg, rate_msg, new_msg]
 
                 # Calculate estimated time to completion
                 if current_rate > 0:
                     remaining_jobs = total_jobs - len(self.completed_jobs)
                     eta = remaining_jobs / current_rate
                     eta_msg = f"Estimated time remaining: {eta:.2f} seconds"
-                    if not self.config.quiet:
-                        print(eta_msg)
-                    self.logger.info(eta_msg)
+                    progress_lines.append(eta_msg)
+
+                # One record, so one write per handler, for the whole round
+                self.logger.info("\n".join(progress_lines), extra=CONSOLE)
 
                 # Wait before next check if not all jobs are complete
-                if len(self.completed_jobs) < total_jobs:
-                    self.logger.debug(
-                        f"Waiting {self.config.interval} seconds before next check"
+                if (
+                    len(self.completed_jobs) < total_jobs
+                    and self.config.verify_mode != "events"
+                ):
+                    # Back off while nothing completes, back to the configured
+                    # interval as soon as jobs complete again. The growth is
+                    # capped every round, so it can't overflow.
+                    if newly_completed:
+                        poll_interval = self.config.interval
+                    else:
+                        poll_interval = min(
+                            max_poll_interval, poll_interval * POLL_BACKOFF
+                        )
+                    delay = min(
+                        poll_interval,
+                        # Don't sleep past the timeout
+                        max(
+                            0,
+                            self.config.timeout
+                            - (time.monotonic() - self.start_time),
+                        ),
                     )
-                    time.sleep(self.config.interval)
+                    self.logger.debug("Waiting %.2f seconds before next check", delay)
+                    await asyncio.sleep(delay)
 
             # Final report
-            self.end_time = time.time()
+            self.end_time = time.monotonic()
             elapsed = self.end_time - self.start_time
 
             final_results = {
@@ -168,7 +445,7 @@ class Verifier:
 
             # Store failed jobs
             if len(self.completed_jobs) < total_jobs:
-                failed_jobs = set(self.job_ids) - self.completed_jobs
+                failed_jobs = self.pending
                 final_results["failed_jobs"] = list(failed_jobs)
                 final_results["failed_count"] = len(failed_jobs)
 
@@ -180,20 +457,14 @@ class Verifier:
 
         except KeyboardInterrupt:
             interrupt_msg = "\nVerification interrupted!"
-            if not self.config.quiet:
-                print(interrupt_msg)
-            self.logger.warning(interrupt_msg)
+            self.logger.warning(interrupt_msg, extra=CONSOLE)
 
-            elapsed = time.time() - self.start_time
+            elapsed = time.monotonic() - self.start_time
             final_status = f"Completed: {len(self.completed_jobs)}/{total_jobs} ({len(self.completed_jobs) / total_jobs * 100:.2f}%)"
             time_elapsed = f"Time elapsed: {elapsed:.2f}s"
 
-            if not self.config.quiet:
-                print(final_status)
-                print(time_elapsed)
-
-            self.logger.info(final_status)
-            self.logger.info(time_elapsed)
+            self.logger.info(final_status, extra=CONSOLE)
+            self.logger.info(time_elapsed, extra=CONSOLE)
 
             return {
                 "status": "interrupted",
@@ -203,9 +474,8 @@ class Verifier:
             }
 
         except Exception as e:
-            self.logger.exception(f"Error during verification: {str(e)}")
-            if not self.config.quiet:
-                print(f"Error during verification: {str(e)}")
+            self.logger.error("Error during verification: %s", e, extra=CONSOLE)
+            self.logger.exception("Error during verification: %s", e)
             return {
                 "status": "error",
                 "error": str(e),
@@ -213,6 +483,13 @@ class Verifier:
                 "total_jobs": total_jobs,
             }
 
+        finally:
+            if self._exit_stack is not None:
+                await self._exit_stack.aclose()
+                self._exit_stack = None
+                self.s3 = None
+                self.sqs = None
+
     def _save_results(self, results):
         """
         Save verification results to file.
@@ -223,25 +500,16 @@ class Verifier:
         results_file = (
             self.config.test_dir / f"verification_results_{int(time.time())}.json"
         )
-        with open(results_file, "w") as f:
-            json.dump(results, f, indent=2)
+        write_json(results_file, results)
         self.logger.info(f"Wrote verification results to {results_file}")
 
     def _log_results(self, results):
         """
-        Log verification results to file and console.
+        Log verification results. They are saved to file by _save_results.
 
         Args:
             results: Verification results dictionary
         """
-        # Save results to JSON file
-        output_file = (
-            self.config.test_dir / f"verification_results_{int(time.time())}.json"
-        )
-        with open(output_file, "w") as f:
-            json.dump(results, f, indent=2)
-        self.logger.info(f"Wrote verification results to {output_file}")
-
         # Log results to log file only
         self.logger.info("\n--- Final Results ---")
         self.logger.info(
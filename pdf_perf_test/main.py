@@ -2,34 +2,36 @@
 Main entry point for PDF performance testing.
 """
 
-import asyncio
 import sys
-from pathlib import Path
-import logging
-from .config import config
+from .config import Config
 from .utils.logging import setup_logging, get_logger
 from .core.runner import TestRunner
+from .utils.event_loop import run
 
 
-async def main():
+async def main(args=None):
     """
     Main function for running PDF performance tests.
 
+    Args:
+        args (argparse.Namespace, optional): Already parsed arguments.
+            If None, arguments are parsed from the command line.
+
     Returns:
         int: Exit code
     """
     try:
-        # Parse command-line arguments
-        config.parse_args()
-
-        # Create the test directory if it doesn't exist
-        Path(config.test_dir).mkdir(parents=True, exist_ok=True)
+        # Use pre-parsed arguments if given, otherwise parse command-line arguments
+        if args is not None:
+            config = Config.from_namespace(args)
+        else:
+            config = Config().parse_args()
 
         # Set up logging with the improved system
         setup_logging(
             log_dir=config.test_dir,
             log_level=config.log_level,
-            console_output=False,  # Never output logs to console, use print statements instead
+            quiet=config.quiet,  # User-facing messages go to stdout unless quiet
         )
 
         # Get logger
@@ -38,6 +40,9 @@ async def main():
             f"Starting PDF performance test v{__import__('pdf_perf_test').__version__}"
         )
 
+        if config.command == "verify":
+            return await _verify(config, logger)
+
         # Run the test
         runner = TestRunner(config)
         results = await runner.run()
@@ -47,6 +52,18 @@ async def main():
             logger.error(f"Test failed: {results.get('error')}")
             return 1
 
+        # Check that the rendered PDFs were found
+        verification = results.get("verification", {})
+        if "status" in verification:
+            logger.error(
+                f"Verification failed: {verification.get('error', verification['status'])}"
+            )
+            return 1
+
+        if verification.get("failed_count"):
+            logger.info("Test completed but not all rendered PDFs were found")
+            return 2
+
         # Check if goal was achieved
         if "performance" in results and not results["performance"]["goal_achieved"]:
             logger.info("Test completed but performance goal was not met")
@@ -60,5 +77,34 @@ async def main():
         return 1
 
 
+async def _verify(config, logger):
+    """
+    Run just the verification phase, for the job IDs in --job-ids-file.
+
+    Args:
+        config: Configuration object
+        logger: Logger of the main module
+
+    Returns:
+        int: Exit code, 1 on errors and 2 if not all jobs were completed
+    """
+    from .core.verifier import Verifier
+
+    results = await Verifier(config).verify()
+
+    if "status" in results:
+        logger.error(f"Verification failed: {results.get('error', results['status'])}")
+        return 1
+
+    if results.get("failed_count"):
+        logger.info(
+            f"Verification completed but {results['failed_count']} jobs did not complete"
+        )
+        return 2
+
+    logger.info("Verification completed successfully")
+    return 0
+
+
 if __name__ == "__main__":
-    sys.exit(asyncio.run(main()))
+    sys.exit(run(main()))
@@ -5,155 +5,286 @@ Generates sample data for PDF rendering requests.
 
 import random
 import datetime
-import uuid
-from decimal import Decimal, ROUND_HALF_UP
+import itertools
+import logging
+from collections import OrderedDict
 from ..utils.logging import get_logger
 
-try:
-    from faker import Faker
+# Faker instance for generating realistic personal data, see _get_faker()
+fake = None
+
+
+def _cached_choices(elements):
+    """Keys and cumulative weights of a weighted OrderedDict, built on first use"""
+    try:
+        return elements._cached_choice_list
+    except AttributeError:
+        elements._cached_choice_list = (
+            tuple(elements),
+            tuple(itertools.accumulate(elements.values())),
+        )
+        return elements._cached_choice_list
+
+
+def _patch_faker():
+    """
+    Replace Faker's random_element(s) with versions that cache the choice list.
+
+    Faker converts a weighted OrderedDict into key and weight lists on every
+    call, which is most of the cost of e.g. fake.first_name(). The cached
+    versions draw from the same distribution with the same (seedable)
+    generator.random.
+    """
+    from faker.providers import BaseProvider
+
+    random_element = BaseProvider.random_element
+    random_elements = BaseProvider.random_elements
+
+    def fast_random_element(self, elements=("a", "b", "c")):
+        if isinstance(elements, OrderedDict):
+            if not getattr(self, "__use_weighting__", True):
+                return self.generator.random.choice(_cached_choices(elements)[0])
+            keys, cum_weights = _cached_choices(elements)
+            return self.generator.random.choices(keys, cum_weights=cum_weights)[0]
+        if isinstance(elements, (tuple, list, str)) and elements:
+            return self.generator.random.choice(elements)
+        return random_element(self, elements)
+
+    def fast_random_elements(
+        self, elements=("a", "b", "c"), length=None, unique=False, use_weighting=None
+    ):
+        if unique or length is None or not isinstance(elements, OrderedDict):
+            return random_elements(self, elements, length, unique, use_weighting)
+        if use_weighting is None:
+            use_weighting = getattr(self, "__use_weighting__", True)
+        keys, cum_weights = _cached_choices(elements)
+        if not use_weighting:
+            return self.generator.random.choices(keys, k=length)
+        return self.generator.random.choices(keys, cum_weights=cum_weights, k=length)
+
+    BaseProvider.random_element = fast_random_element
+    BaseProvider.random_elements = fast_random_elements
+
+
+def _get_faker():
+    """
+    Create the Faker instance on first use instead of at import time.
+
+    Building it reads the locale data, so it is deferred until the customer
+    pools are filled. Only the providers used for customers are loaded.
+
+    Returns:
+        Faker: The shared instance, or None if Faker is not installed
+    """
+    global fake
+    if fake is None:
+        try:
+            from faker import Faker
+        except ImportError:
+            # Fallback if Faker is not installed
+            return None
+        _patch_faker()
+        fake = Faker(
+            "de_DE",  # German locale
+            providers=[
+                "faker.providers.person",
+                "faker.providers.address",
+                "faker.providers.internet",
+            ],
+        )
+    return fake
 
-    # Initialize Faker for generating realistic personal data
-    fake = Faker("de_DE")  # German locale
-except ImportError:
-    # Fallback if Faker is not installed
-    fake = None
 
 # Initialize logger
 logger = get_logger("data_generator")
 
 
+# The fixed company of every confirmation, shared and never modified
+_COMPANY = {
+    "logo": None,
+    "name": "MoneyBank",
+    "address": "Kantstraße 123, 10623 Berlin, Germany",
+    "phone": "+49 30 8765 4321",
+}
+
+# Stocks to trade as (symbol, name, lowest price, highest price)
+_GERMAN_STOCKS = (
+    ("SIE.DE", "Siemens AG", 150, 200),
+    ("SAP.DE", "SAP SE", 180, 220),
+    ("BAS.DE", "BASF SE", 40, 60),
+    ("DTE.DE", "Deutsche Telekom AG", 18, 25),
+    ("BMW.DE", "Bayerische Motoren Werke AG", 80, 100),
+    ("ALV.DE", "Allianz SE", 200, 250),
+    ("BAYN.DE", "Bayer AG", 30, 50),
+    ("DAI.DE", "Daimler AG", 60, 80),
+    ("DBK.DE", "Deutsche Bank AG", 10, 15),
+    ("DPW.DE", "Deutsche Post AG", 40, 50),
+)
+
+
+# English month names for the transaction date, independent of the locale
+_MONTHS = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+
+
 def generate_company():
     """For now, we use a fixed company"""
     logger.debug("Generating company data")
-    return {
-        "logo": None,
-        "name": "MoneyBank",
-        "address": "Kantstraße 123, 10623 Berlin, Germany",
-        "phone": "+49 30 8765 4321",
-    }
+    return _COMPANY
 
 
-def generate_customer(customer_id=None):
-    """Generate a random customer, or a specific one based on customer_id"""
-    # If customer_id is provided, seed the random generator to get consistent results
-    if customer_id is not None:
-        logger.debug(f"Generating customer with seed {customer_id}")
-        random.seed(customer_id)
-        if fake:
-            fake.seed_instance(customer_id)
-    else:
-        logger.debug("Generating random customer")
+# Pre-generated customer data, generate_customer() picks from these pools
+# instead of calling Faker for every customer
+POOL_SIZE = 10000
+_NAME_POOL = ()
+_ADDR_POOL = ()
+_DOMAIN_POOL = ()
 
+
+def _init_pools():
+    """Fill the customer data pools on first use, reproducibly seeded"""
+    global _NAME_POOL, _ADDR_POOL, _DOMAIN_POOL
+    if _NAME_POOL:
+        return
+
+    logger.debug("Generating customer data pools of size %d", POOL_SIZE)
+    fake = _get_faker()
     if fake:
-        first_name = fake.first_name()
-        last_name = fake.last_name()
-        email = (
-            f"{first_name[0].lower()}.{last_name.lower()}@{fake.free_email_domain()}"
+        fake.seed_instance(0)
+        _NAME_POOL = tuple(
+            (fake.first_name(), fake.last_name()) for _ in range(POOL_SIZE)
+        )
+        _ADDR_POOL = tuple(
+            f"{fake.street_address()}, {fake.postcode()} {fake.city()}, Germany"
+            for _ in range(POOL_SIZE)
+        )
+        # Distinct domains, in a reproducible order
+        _DOMAIN_POOL = tuple(
+            dict.fromkeys(fake.free_email_domain() for _ in range(100))
         )
-        address = f"{fake.street_address()}, {fake.postcode()} {fake.city()}, Germany"
     else:
         # Fallback if Faker is not installed
+        rng = random.Random(0)
         names = ["Max", "Anna", "Felix", "Sophie", "Thomas"]
         surnames = ["Müller", "Schmidt", "Schneider", "Fischer", "Weber"]
-        domains = ["gmail.com", "yahoo.com", "web.de", "outlook.com"]
-        first_name = random.choice(names)
-        last_name = random.choice(surnames)
-        email = f"{first_name[0].lower()}.{last_name.lower()}@{random.choice(domains)}"
-        address = f"Hauptstraße {random.randint(1, 200)}, {random.randint(10000, 99999)} Berlin, Germany"
+        _NAME_POOL = tuple(itertools.product(names, surnames))
+        _ADDR_POOL = tuple(
+            f"Hauptstraße {rng.randint(1, 200)}, {rng.randint(10000, 99999)} Berlin, Germany"
+            for _ in range(POOL_SIZE)
+        )
+        _DOMAIN_POOL = ("gmail.com", "yahoo.com", "web.de", "outlook.com")
+
+
+def generate_customer(customer_id=None):
+    """Generate a random customer, or a specific one based on customer_id"""
+    _init_pools()
 
-    # Reset the random seed if we set it
+    # If customer_id is provided, use a generator seeded with it to get
+    # consistent results, without touching the global random state
     if customer_id is not None:
-        random.seed()
-        if fake:
-            fake.seed_instance()
+        logger.debug("Generating customer with seed %s", customer_id)
+        rng = random.Random(customer_id)
+    else:
+        logger.debug("Generating random customer")
+        rng = random
+
+    first_name, last_name = rng.choice(_NAME_POOL)
+    email = f"{first_name[0].lower()}.{last_name.lower()}@{rng.choice(_DOMAIN_POOL)}"
 
     return {
         "name": f"{first_name} {last_name}",
-        "address": address,
+        "address": rng.choice(_ADDR_POOL),
         "email": email,
     }
 
 
-def generate_transaction():
-    """Generate transaction details"""
+def generate_transaction(now=None, rng=random):
+    """
+    Generate transaction details, dated relative to now (default: current time).
+
+    Random values are drawn from rng, the random module unless a seeded
+    random.Random is passed in.
+    """
     logger.debug("Generating transaction details")
 
+    if now is None:
+        now = datetime.datetime.now()
+
     # Generate a date in the past month
-    date = datetime.datetime.now() - datetime.timedelta(days=random.randint(1, 30))
-    date_str = date.strftime("%d %B %Y")
+    date = now - datetime.timedelta(days=rng.randint(1, 30))
+    date_str = f"{date.day:02d} {_MONTHS[date.month - 1]} {date.year}"
 
     # Generate reference number
     ref_prefix = "MB-TR-"
-    ref_number = f"{ref_prefix}{date.strftime('%y%m%d')}{random.randint(10, 99)}"
+    ref_number = f"{ref_prefix}{date.year % 100:02d}{date.month:02d}{date.day:02d}{rng.randint(10, 99)}"
 
     # Generate client code
     client_prefix = ref_prefix.replace("-TR-", "-C")
-    client_code = f"{client_prefix}{random.randint(10000, 99999)}"
+    client_code = f"{client_prefix}{rng.randint(10000, 99999)}"
 
     return {
         "date": date_str,
         "reference": ref_number,
         "currency": "EUR",
         "client_code": client_code,
-        "commission_percent": f"{random.randint(5, 20) / 100:.2f}",
-        "minimum_fee": f"{random.randint(495, 1295) / 100:.2f}",
+        "commission_percent": f"{rng.randint(5, 20) / 100:.2f}",
+        "minimum_fee": f"{rng.randint(495, 1295) / 100:.2f}",
     }
 
 
+# Swaps the English thousand and decimal separators for the German ones
+_DE_SEPARATORS = str.maketrans({",": ".", ".": ","})
+
+
 def format_amount(amount):
-    """Format amount with thousand separators"""
+    """Format amount, rounded to 2 decimal places, with thousand separators"""
     if isinstance(amount, str) and amount == "":
         return ""
 
-    # Convert to Decimal for proper rounding
-    decimal_amount = Decimal(str(amount))
-    # Round to 2 decimal places
-    rounded = decimal_amount.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-
     # Format with thousand separators
-    formatted = f"{rounded:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
-
-    return formatted
+    return f"{amount:,.2f}".translate(_DE_SEPARATORS)
 
 
-def generate_stock_details(num_trades=4):
-    """Generate stock transaction details"""
-    logger.debug(f"Generating stock details with {num_trades} trades")
-
-    german_stocks = [
-        {"symbol": "SIE.DE", "name": "Siemens AG", "price_range": (150, 200)},
-        {"symbol": "SAP.DE", "name": "SAP SE", "price_range": (180, 220)},
-        {"symbol": "BAS.DE", "name": "BASF SE", "price_range": (40, 60)},
-        {"symbol": "DTE.DE", "name": "Deutsche Telekom AG", "price_range": (18, 25)},
-        {
-            "symbol": "BMW.DE",
-            "name": "Bayerische Motoren Werke AG",
-            "price_range": (80, 100),
-        },
-        {"symbol": "ALV.DE", "name": "Allianz SE", "price_range": (200, 250)},
-        {"symbol": "BAYN.DE", "name": "Bayer AG", "price_range": (30, 50)},
-        {"symbol": "DAI.DE", "name": "Daimler AG", "price_range": (60, 80)},
-        {"symbol": "DBK.DE", "name": "Deutsche Bank AG", "price_range": (10, 15)},
-        {"symbol": "DPW.DE", "name": "Deutsche Post AG", "price_range": (40, 50)},
-    ]
+def generate_stock_details(num_trades=4, rng=random):
+    """Generate stock transaction details, drawing random values from rng"""
+    logger.debug("Generating stock details with %d trades", num_trades)
+    # The debug messages format amounts, only do that if they are logged
+    debug = logger.isEnabledFor(logging.DEBUG)
 
     details = []
-    total_buy = Decimal("0")
-    total_sell = Decimal("0")
+    total_buy = 0.0
+    total_sell = 0.0
 
     # Randomly select stocks without replacement
-    selected_stocks = random.sample(german_stocks, min(num_trades, len(german_stocks)))
+    selected_stocks = rng.sample(
+        _GERMAN_STOCKS, min(num_trades, len(_GERMAN_STOCKS))
+    )
 
-    for stock in selected_stocks:
-        # Randomly decide if this is a buy or sell
-        is_buy = random.choice([True, False])
+    # Draw the per-trade values for all trades at once: buy or sell, lots
+    # and shares. Prices are uniform between each stock's lowest and highest.
+    count = len(selected_stocks)
+    trades = zip(
+        selected_stocks,
+        rng.choices((True, False), k=count),
+        rng.choices((1, 2, 3), k=count),
+        rng.choices((25, 50, 75, 100, 125), k=count),
+    )
 
-        lots = random.randint(1, 3)
-        shares = random.randint(1, 5) * 25  # 25, 50, 75, 100, 125
-        price = Decimal(
-            str(random.uniform(stock["price_range"][0], stock["price_range"][1]))
-        )
-        amount = price * Decimal(str(shares))
+    for (symbol, name, price_low, price_high), is_buy, lots, shares in trades:
+        price = price_low + (price_high - price_low) * rng.random()
+        amount = price * shares
 
         # Format as required
         buy_amount = "" if not is_buy else format_amount(amount)
@@ -165,14 +296,19 @@ def generate_stock_details(num_trades=4):
         else:
             total_sell += amount
 
-        trade_type = "buy" if is_buy else "sell"
-        logger.debug(
-            f"Generated {trade_type} trade for {stock['name']} ({stock['symbol']}): {shares} shares at {format_amount(price)}"
-        )
+        if debug:
+            logger.debug(
+                "Generated %s trade for %s (%s): %d shares at %s",
+                "buy" if is_buy else "sell",
+                name,
+                symbol,
+                shares,
+                format_amount(price),
+            )
 
         details.append(
             {
-                "stock": f"{stock['name']} ({stock['symbol']})",
+                "stock": f"{name} ({symbol})",
                 "lots": str(lots),
                 "shares": str(shares),
                 "price": format_amount(price),
@@ -183,49 +319,55 @@ def generate_stock_details(num_trades=4):
 
     # Calculate the gross amount
     gross_amount = total_sell - total_buy
-    logger.debug(
-        f"Total buy: {format_amount(total_buy)}, Total sell: {format_amount(total_sell)}, Gross amount: {format_amount(gross_amount)}"
-    )
+    if debug:
+        logger.debug(
+            f"Total buy: {format_amount(total_buy)}, Total sell: {format_amount(total_sell)}, Gross amount: {format_amount(gross_amount)}"
+        )
 
     return details, gross_amount, total_buy, total_sell
 
 
 def generate_summary(gross_amount, commission_percent, minimum_fee):
     """Generate financial summary based on transaction details"""
-    logger.debug(
-        f"Generating summary with gross amount {format_amount(gross_amount)}, commission {commission_percent}%, minimum fee {minimum_fee}"
-    )
+    # The debug messages format amounts, only do that if they are logged
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug(
+            f"Generating summary with gross amount {format_amount(gross_amount)}, commission {commission_percent}%, minimum fee {minimum_fee}"
+        )
 
-    # Convert commission_percent to a decimal
-    commission_rate = Decimal(commission_percent)
-    min_fee = Decimal(minimum_fee)
+    # Amounts are plain floats, they are only rounded when formatted
+    commission_rate = float(commission_percent)
+    min_fee = float(minimum_fee)
 
     # Calculate brokerage fee (commission based on gross amount)
-    brokerage_fee = Decimal(str(abs(gross_amount))) * commission_rate / Decimal("100")
+    brokerage_fee = abs(gross_amount) * commission_rate / 100
     # Apply minimum fee if necessary
     if brokerage_fee < min_fee:
-        logger.debug(
-            f"Applying minimum fee {format_amount(min_fee)} (calculated fee was {format_amount(brokerage_fee)})"
-        )
+        if debug:
+            logger.debug(
+                f"Applying minimum fee {format_amount(min_fee)} (calculated fee was {format_amount(brokerage_fee)})"
+            )
         brokerage_fee = min_fee
 
     # VAT on brokerage fee (19% in Germany)
-    vat_rate = Decimal("0.19")
+    vat_rate = 0.19
     vat_brokerage_fee = brokerage_fee * vat_rate
 
     # Total charges
     total_charges = brokerage_fee + vat_brokerage_fee
 
     # Sales tax (assuming 0 for this example)
-    sales_tax = Decimal("0.00")
+    sales_tax = 0.0
 
     # Withholding tax (approximately 25% of gains in Germany)
-    withholding_tax = Decimal("0.00")
+    withholding_tax = 0.0
     if gross_amount > 0:  # Only apply on profits
-        withholding_tax = gross_amount * Decimal("0.25")
-        logger.debug(
-            f"Applied withholding tax of {format_amount(withholding_tax)} on profit"
-        )
+        withholding_tax = gross_amount * 0.25
+        if debug:
+            logger.debug(
+                f"Applied withholding tax of {format_amount(withholding_tax)} on profit"
+            )
 
     return (
         {
@@ -241,22 +383,32 @@ def generate_summary(gross_amount, commission_percent, minimum_fee):
     )
 
 
-def generate_trade_confirmation(customer_id=None, confirmation_id=None):
-    """Generate a complete trade confirmation"""
+def generate_trade_confirmation(
+    customer_id=None, confirmation_id=None, company=None, now=None
+):
+    """
+    Generate a complete trade confirmation.
+
+    company and now can be passed in to share them between confirmations,
+    see generate_trade_confirmations().
+    """
     logger.debug(
-        f"Generating trade confirmation for customer_id={customer_id}, confirmation_id={confirmation_id}"
+        "Generating trade confirmation for customer_id=%s, confirmation_id=%s",
+        customer_id,
+        confirmation_id,
     )
 
-    # Use the seed for consistent but different results
-    if confirmation_id is not None:
-        random.seed(confirmation_id)
+    # Use a generator seeded with the confirmation ID for consistent but
+    # different results, without reseeding the global random state
+    rng = random.Random(confirmation_id) if confirmation_id is not None else random
 
-    company = generate_company()
+    if company is None:
+        company = generate_company()
     customer = generate_customer(customer_id)
-    transaction = generate_transaction()
+    transaction = generate_transaction(now, rng)
 
     # Generate stock details and get the gross amount
-    details, gross_amount, total_buy, total_sell = generate_stock_details()
+    details, gross_amount, total_buy, total_sell = generate_stock_details(rng=rng)
 
     # Generate summary
     summary, total_charges, withholding_tax = generate_summary(
@@ -274,13 +426,10 @@ def generate_trade_confirmation(customer_id=None, confirmation_id=None):
     # Due amount is the same as total amount in this example
     due_amount = total_amount
 
-    # Reset the random seed if we set it
-    if confirmation_id is not None:
-        random.seed()
-
-    logger.debug(
-        f"Generated confirmation with total amount: {format_amount(total_amount)}"
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"Generated confirmation with total amount: {format_amount(total_amount)}"
+        )
 
     return {
         "company": company,
@@ -291,3 +440,25 @@ def generate_trade_confirmation(customer_id=None, confirmation_id=None):
         "total_amount": format_amount(total_amount),
         "due_amount": format_amount(due_amount),
     }
+
+
+def generate_trade_confirmations(first_customer_id, count):
+    """
+    Generate trade confirmations for consecutive customer IDs.
+
+    The company data and the reference time are the same for every
+    confirmation, so they are built once and shared by the whole batch.
+
+    Args:
+        first_customer_id (int): Customer ID of the first confirmation
+        count (int): Number of confirmations to generate
+
+    Returns:
+        list: Trade confirmations
+    """
+    company = generate_company()
+    now = datetime.datetime.now()
+    return [
+        generate_trade_confirmation(customer_id, company=company, now=now)
+        for customer_id in range(first_customer_id, first_customer_id + count)
+    ]
@@ -0,0 +1,34 @@
+"""
+Event loop helpers for PDF performance testing.
+Runs coroutines on uvloop when it is installed.
+"""
+
+import asyncio
+import sys
+
+try:
+    import uvloop
+except ImportError:
+    # Fallback to the default asyncio event loop if uvloop is not installed
+    # (it is not available on Windows)
+    uvloop = None
+
+
+def run(coro):
+    """
+    Run a coroutine to completion, on uvloop if available.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    if uvloop is None:
+        return asyncio.run(coro)
+
+    if sys.version_info >= (3, 12):
+        return asyncio.run(coro, loop_factory=uvloop.new_event_loop)
+
+    uvloop.install()
+    return asyncio.run(coro)
@@ -3,11 +3,21 @@ Centralized logging configuration for the PDF performance testing tool.
 """
 
 import logging
-import os
+import threading
 from pathlib import Path
 from datetime import datetime
 import sys
 
+# Pass as `extra` to a logging call to also show the message on stdout
+CONSOLE = {"console": True}
+
+
+class _ConsoleFilter(logging.Filter):
+    """Only lets through records that were logged with extra=CONSOLE"""
+
+    def filter(self, record):
+        return getattr(record, "console", False)
+
 
 class LogManager:
     """
@@ -17,6 +27,7 @@ class LogManager:
     _instance = None
     _initialized = False
     _loggers = {}
+    _lock = threading.Lock()
 
     def __new__(cls):
         """Singleton pattern implementation"""
@@ -34,14 +45,15 @@ class LogManager:
             self.main_file_handler = None
             LogManager._initialized = True
 
-    def setup(self, log_dir=None, log_level=logging.INFO, console_output=True):
+    def setup(self, log_dir=None, log_level=logging.INFO, quiet=False):
         """
         Set up the logging system with the specified configuration.
 
         Args:
             log_dir (str, optional): Directory to store log files. If None, logs are only shown in console.
             log_level (int, optional): Logging level to use. Defaults to logging.INFO.
-            console_output (bool, optional): Whether to output logs to console. Defaults to True.
+            quiet (bool, optional): Whether to suppress the plain user-facing messages
+                logged with extra=CONSOLE on stdout. Defaults to False.
         """
         self.log_level = log_level
 
@@ -61,18 +73,22 @@ class LogManager:
             self.main_file_handler.setFormatter(formatter)
             self.handlers["main_file"] = self.main_file_handler
 
-        # Set up console handler if requested
-        if console_output:
-            console_handler = logging.StreamHandler(sys.stdout)
-            # Set console level to WARNING if quiet mode, otherwise use log_level
-            console_handler.setLevel(
-                logging.WARNING if not console_output else self.log_level
-            )
-            formatter = logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-            )
-            console_handler.setFormatter(formatter)
-            self.handlers["console"] = console_handler
+        # User-facing messages (extra=CONSOLE) are shown as plain text on stdout.
+        # There is no formatted console handler next to it, it would print
+        # every one of these messages a second time.
+        # In quiet mode the handler stays attached but lets nothing through.
+        stdout_handler = logging.StreamHandler(sys.stdout)
+        stdout_handler.setLevel(logging.CRITICAL if quiet else logging.INFO)
+        stdout_handler.setFormatter(logging.Formatter("%(message)s"))
+        stdout_handler.addFilter(_ConsoleFilter())
+        self.handlers["stdout"] = stdout_handler
+
+        # Loggers fetched at import time, before this setup, get the new
+        # level and handlers too
+        with self._lock:
+            for logger in self._loggers.values():
+                logger.setLevel(self.log_level)
+                logger.handlers = list(self.handlers.values())
 
     def get_logger(self, name):
         """
@@ -84,38 +100,48 @@ class LogManager:
         Returns:
             logging.Logger: Configured logger.
         """
-        if name in self._loggers:
-            return self._loggers[name]
+        logger = self._loggers.get(name)
+        if logger is not None:
+            return logger
+
+        with self._lock:
+            # Another thread may have configured it while we waited
+            if name in self._loggers:
+                return self._loggers[name]
+
+            logger = logging.getLogger(name)
+            logger.setLevel(self.log_level)
+            logger.handlers = []  # Clear any existing handlers
 
-        logger = logging.getLogger(name)
-        logger.setLevel(self.log_level)
-        logger.handlers = []  # Clear any existing handlers
+            # Add all handlers
+            for handler in self.handlers.values():
+                logger.addHandler(handler)
 
-        # Add all handlers
-        for handler in self.handlers.values():
-            logger.addHandler(handler)
+            # All output goes through the handlers above, don't also walk up
+            # to the root logger's handlers
+            logger.propagate = False
 
-        # We no longer create separate log files for each component
-        # Instead, we use a single main log file with component names in the log format
+            # We no longer create separate log files for each component
+            # Instead, we use a single main log file with component names in the log format
 
-        self._loggers[name] = logger
-        return logger
+            self._loggers[name] = logger
+            return logger
 
 
 # Singleton instance
 log_manager = LogManager()
 
 
-def setup_logging(log_dir=None, log_level=logging.INFO, console_output=True):
+def setup_logging(log_dir=None, log_level=logging.INFO, quiet=False):
     """
     Initialize the logging system.
 
     Args:
         log_dir (str, optional): Directory to store log files.
         log_level (int, optional): Logging level to use.
-        console_output (bool, optional): Whether to output logs to console.
+        quiet (bool, optional): Whether to suppress user-facing messages on stdout.
     """
-    log_manager.setup(log_dir, log_level, console_output)
+    log_manager.setup(log_dir, log_level, quiet)
 
 
 def get_logger(name):
@@ -0,0 +1,50 @@
+"""
+JSON serialization helpers for PDF performance testing.
+Uses orjson when it is installed and falls back to the standard library.
+"""
+
+import json
+
+try:
+    import orjson
+
+    def dumps(obj):
+        """Serialize an object to compact JSON bytes"""
+        return orjson.dumps(obj)
+
+    def loads(data):
+        """Deserialize JSON from bytes or str"""
+        return orjson.loads(data)
+
+    def _dumps_pretty(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+
+except ImportError:
+    # Fallback if orjson is not installed
+    orjson = None
+
+    def dumps(obj):
+        """Serialize an object to compact JSON bytes"""
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def loads(data):
+        """Deserialize JSON from bytes or str"""
+        return json.loads(data)
+
+    def _dumps_pretty(obj):
+        return (json.dumps(obj, indent=2) + "\n").encode()
+
+
+# Headers for requests whose body was serialized with dumps()
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def write_json(path, obj):
+    """
+    Write an object to a file as indented JSON, in a single write.
+
+    Args:
+        path (Path): File to write
+        obj: JSON-serializable object
+    """
+    path.write_bytes(_dumps_pretty(obj))
@@ -59,6 +59,11 @@ output "results_bucket" {
   value       = module.pdf_service.results_bucket
 }
 
+output "results_notifications_queue_url" {
+  description = "URL of the SQS queue notified of rendered PDFs"
+  value       = module.pdf_service.results_notifications_queue_url
+}
+
 output "renderer_function_name" {
   description = "Name of the renderer Lambda function"
   value       = module.pdf_service.renderer_function_name
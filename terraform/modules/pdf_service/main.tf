@@ -20,6 +20,50 @@ resource "aws_s3_bucket" "results" {
 # Current region data source
 data "aws_region" "current" {}
 
+# Queue notified of every rendered PDF, consumed by the performance test
+# verifier instead of polling the results bucket
+resource "aws_sqs_queue" "results_notifications" {
+  name                      = "${var.project_name}-results-notifications-${var.environment}"
+  message_retention_seconds = 86400
+  receive_wait_time_seconds = 20
+  tags                      = local.common_tags
+}
+
+resource "aws_sqs_queue_policy" "results_notifications" {
+  queue_url = aws_sqs_queue.results_notifications.id
+
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Action = "sqs:SendMessage"
+        Effect = "Allow"
+        Principal = {
+          Service = "s3.amazonaws.com"
+        }
+        Resource = aws_sqs_queue.results_notifications.arn
+        Condition = {
+          ArnEquals = {
+            "aws:SourceArn" = aws_s3_bucket.results.arn
+          }
+        }
+      }
+    ]
+  })
+}
+
+resource "aws_s3_bucket_notification" "results" {
+  bucket = aws_s3_bucket.results.id
+
+  queue {
+    queue_arn     = aws_sqs_queue.results_notifications.arn
+    events        = ["s3:ObjectCreated:*"]
+    filter_suffix = ".pdf"
+  }
+
+  depends_on = [aws_sqs_queue_policy.results_notifications]
+}
+
 
 
 # PDF Renderer Lambda Function
@@ -13,6 +13,11 @@ output "results_bucket" {
   value       = aws_s3_bucket.results.id
 }
 
+output "results_notifications_queue_url" {
+  description = "The URL of the queue notified of rendered PDFs"
+  value       = aws_sqs_queue.results_notifications.url
+}
+
 
 output "renderer_function_name" {
   description = "The name of the renderer Lambda function"